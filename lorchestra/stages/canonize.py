@@ -4,11 +4,14 @@ Canonize stage: Transform source data to canonical format.
 Uses CanonizerAdapter to apply JSONata transforms with vault LATEST pointer support.
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Set
 
 from lorchestra.config import StageConfig
 from lorchestra.stages.base import Stage, StageResult
 from lorchestra.tools.canonizer import CanonizerAdapter
+from lorchestra.utils import validate_file_is_jsonl_sampled
 
 
 class CanonizeStage(Stage):
@@ -30,6 +33,7 @@ class CanonizeStage(Stage):
         self.adapter = CanonizerAdapter(
             canonizer_dir=canonizer_dir,
             transform_registry=transform_registry,
+            max_workers=self.config.get("max_workers"),
         )
 
     def validate(self) -> None:
@@ -74,10 +78,11 @@ class CanonizeStage(Stage):
         )
 
         total_records = 0
-        output_files = []
+        output_files: Set[Path] = set()
         errors = []
+        jobs = {}
 
-        # Process each mapping
+        # Discover LATEST manifests for each mapping
         for mapping in mappings:
             source_path = mapping["source_pattern"]  # e.g., "email/gmail"
             transform_name = mapping["transform"]
@@ -110,21 +115,55 @@ class CanonizeStage(Stage):
                 },
             )
 
-            # Process each manifest using adapter
             for manifest_path in manifests:
-                try:
-                    result = self.adapter.transform_from_manifest(
+                # Overlapping source patterns can match the same manifest; the
+                # first mapping wins so one output is not written twice
+                if manifest_path in jobs:
+                    error_msg = (
+                        f"Manifest {manifest_path} matched by multiple mappings, "
+                        f"keeping transform {jobs[manifest_path]}"
+                    )
+                    errors.append(error_msg)
+                    self.logger.error(
+                        error_msg,
+                        extra={
+                            "stage": self.name,
+                            "event": "duplicate_manifest",
+                            "metadata": {
+                                "manifest": str(manifest_path),
+                                "source_path": source_path,
+                            },
+                        },
+                    )
+                    continue
+
+                jobs[manifest_path] = transform_name
+
+        # Transform manifests concurrently; these threads only wait on the
+        # adapter's shared batch pool, which bounds canonizer processes
+        with ThreadPoolExecutor(max_workers=self.adapter.max_workers) as executor:
+            futures = [
+                (
+                    manifest_path,
+                    executor.submit(
+                        self.adapter.transform_from_manifest,
                         manifest_path=manifest_path,
                         transform_name=transform_name,
                         output_dir=output_dir,
                         logger=self.logger,
-                    )
+                    ),
+                )
+                for manifest_path, transform_name in jobs.items()
+            ]
 
+            for manifest_path, future in futures:
+                try:
+                    result = future.result()
                     records_processed = result["records"]
                     total_records += records_processed
 
                     if result["output_file"]:
-                        output_files.append(result["output_file"])
+                        output_files.add(Path(result["output_file"]))
 
                     self.logger.info(
                         f"Transformed {records_processed} records from {result['account']}",
@@ -155,6 +194,20 @@ class CanonizeStage(Stage):
                         },
                     )
 
+        # Spot-check each output once, instead of re-reading it in full
+        for output_file in sorted(output_files):
+            if not validate_file_is_jsonl_sampled(output_file):
+                error_msg = f"Canonical output is not valid JSONL: {output_file}"
+                errors.append(error_msg)
+                self.logger.error(
+                    error_msg,
+                    extra={
+                        "stage": self.name,
+                        "event": "invalid_output",
+                        "metadata": {"output_file": str(output_file)},
+                    },
+                )
+
         # Check if we had errors
         if errors and total_records == 0:
             # All transforms failed
@@ -170,7 +223,7 @@ class CanonizeStage(Stage):
             success=True,
             duration_seconds=0,  # Will be set by base class
             records_processed=total_records,
-            output_files=output_files,
+            output_files=sorted(output_files),
             metadata={
                 "transform_registry": str(self.adapter.transform_registry),
                 "mappings_applied": len(mappings),
@@ -179,6 +232,5 @@ class CanonizeStage(Stage):
         )
 
     def cleanup(self) -> None:
-        """Clean up temporary files if needed."""
-        # No cleanup needed for canonize stage
-        pass
+        """Shut down the adapter's canonizer worker pool."""
+        self.adapter.close()
@@ -1,15 +1,75 @@
 """Canonizer tool adapter for lorchestra."""
 
-import gzip
-import json
+import contextlib
+import functools
+import os
+import re
+import shutil
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
 
 import yaml
 
+try:
+    # ISA-L decompresses gzip 2-3x faster than zlib, with the same API
+    from isal import igzip as gzip_impl
+
+    HAS_ISAL = True
+except ImportError:
+    import gzip as gzip_impl
+
+    HAS_ISAL = False
+
+try:
+    # orjson parses LATEST/manifest JSON faster, straight from bytes
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
 from lorchestra.tools.base import ToolAdapter
 
+# Block size for streaming bytes between gzip parts, canonizer, and output files
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Decompressed read size for gzip parts (READ_BUFFER_SIZE on gzip 3.12+ and isal)
+GZIP_READ_SIZE = getattr(gzip_impl, "READ_BUFFER_SIZE", 128 * 1024)
+
+# Decompressed bytes per canonizer invocation when batching small parts
+BATCH_TARGET_BYTES = 256 * 1024 * 1024
+
+# Lines that count_jsonl_records() skips: empty or ASCII whitespace only
+BLANK_LINE = re.compile(rb"^[ \t\r\f\v]*\n", re.MULTILINE)
+
+
+@functools.lru_cache(maxsize=64)
+def _resolve_transform_meta(transform_registry: str, transform_name: str) -> Path:
+    """
+    Resolve and validate a transform's metadata file, memoized across adapters.
+
+    Takes string arguments so the cache key is hashable and stable. Missing
+    transforms raise and are not cached.
+
+    Args:
+        transform_registry: Transform registry directory
+        transform_name: Transform name (e.g., "email/gmail_to_canonical_v1")
+
+    Returns:
+        Path to the transform's .meta.yaml file
+
+    Raises:
+        FileNotFoundError: If transform metadata does not exist
+    """
+    transform_meta = Path(transform_registry) / f"{transform_name}.meta.yaml"
+
+    if not transform_meta.exists():
+        raise FileNotFoundError(f"Transform metadata not found: {transform_meta}")
+
+    return transform_meta
+
 
 class CanonizerAdapter(ToolAdapter):
     """
@@ -26,6 +86,7 @@ class CanonizerAdapter(ToolAdapter):
         canonizer_dir: Path,
         transform_registry: Path,
         config_cache: Optional[Path] = None,
+        max_workers: Optional[int] = None,
     ):
         """
         Initialize CanonizerAdapter.
@@ -34,11 +95,27 @@ class CanonizerAdapter(ToolAdapter):
             canonizer_dir: Path to canonizer repo directory (e.g., /home/user/canonizer)
             transform_registry: Path to transform registry (e.g., /home/user/transforms)
             config_cache: Path to cached config file (defaults to config/tools/canonizer.yaml)
+            max_workers: Concurrent canonizer processes (defaults to CPU count)
         """
         self.canonizer_dir = Path(canonizer_dir)
         self.transform_registry = Path(transform_registry)
         self.venv_path = self.canonizer_dir / ".venv"
         self.can_bin = self.venv_path / "bin" / "can"
+        self.max_workers = max_workers or os.cpu_count() or 1
+        # External decompressor for parts (pigz also decompresses on extra
+        # threads), unless in-process ISA-L is installed
+        self.decompress_bin = (
+            None if HAS_ISAL else shutil.which("pigz") or shutil.which("gzip")
+        )
+        self._created_dirs: Set[Path] = set()
+        # One batch pool shared by every manifest, so concurrent manifests
+        # never run more than max_workers canonizer processes in total
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        # Output files written since the last close(); a second manifest that
+        # resolves to one of them is rejected before anything is cleared
+        self._claimed_outputs: Set[Path] = set()
+        self._claims_lock = threading.Lock()
 
         if config_cache is None:
             config_cache = Path("config/tools/canonizer.yaml")
@@ -170,27 +247,23 @@ class CanonizerAdapter(ToolAdapter):
         manifests = []
         source_dir = vault_root / source_path
 
-        if not source_dir.exists():
-            return manifests
-
         # Find all account directories under this source
         # e.g., vault/email/gmail/ben-mensio/, vault/email/gmail/drben/, etc.
-        for account_dir in source_dir.iterdir():
-            if not account_dir.is_dir():
-                continue
+        # scandir entries cache the file type, so is_dir() needs no extra stat
+        try:
+            with os.scandir(source_dir) as entries:
+                account_dirs = [entry.path for entry in entries if entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return manifests
 
+        for account_dir in account_dirs:
             # Look for LATEST.json marker
-            latest_marker = account_dir / "LATEST.json"
-
-            if not latest_marker.exists():
-                if logger:
-                    logger.debug(f"No LATEST.json found in {account_dir}, skipping")
-                continue
+            latest_marker = os.path.join(account_dir, "LATEST.json")
 
             try:
                 # Read LATEST.json to get dt and run_id
-                with open(latest_marker, "r") as f:
-                    latest_data = json.load(f)
+                with open(latest_marker, "rb") as f:
+                    latest_data = json_loads(f.read())
 
                 dt = latest_data.get("dt")
                 run_id = latest_data.get("run_id")
@@ -201,24 +274,29 @@ class CanonizerAdapter(ToolAdapter):
                     continue
 
                 # Build path to manifest
-                manifest_path = (
-                    account_dir / f"dt={dt}" / f"run_id={run_id}" / "manifest.json"
+                manifest_path = os.path.join(
+                    account_dir, f"dt={dt}", f"run_id={run_id}", "manifest.json"
                 )
 
-                if not manifest_path.exists():
+                if not os.path.exists(manifest_path):
                     if logger:
                         logger.warning(
                             f"LATEST points to non-existent run: {manifest_path}"
                         )
                     continue
 
-                manifests.append(manifest_path)
+                manifests.append(Path(manifest_path))
 
                 if logger:
                     logger.debug(
-                        f"Found LATEST manifest for {account_dir.name}: {dt}/{run_id}"
+                        f"Found LATEST manifest for {os.path.basename(account_dir)}: "
+                        f"{dt}/{run_id}"
                     )
 
+            except FileNotFoundError:
+                if logger:
+                    logger.debug(f"No LATEST.json found in {account_dir}, skipping")
+
             except Exception as e:
                 if logger:
                     logger.warning(f"Could not read LATEST.json in {account_dir}: {e}")
@@ -236,7 +314,11 @@ class CanonizerAdapter(ToolAdapter):
         Transform data from a vault manifest with LATEST pointer support.
 
         Processes all parts in the manifest, decompressing gzip chunks and
-        piping through canonizer. Clears existing output file for idempotency.
+        piping through canonizer. Parts are grouped into batches that share one
+        canonizer process; batches run on the adapter's shared worker pool and
+        are concatenated in seq order. Clears existing output file for
+        idempotency. Safe to call from several threads at once; each output
+        file may be written by only one manifest until close() is called.
 
         Args:
             manifest_path: Path to manifest.json
@@ -253,11 +335,12 @@ class CanonizerAdapter(ToolAdapter):
 
         Raises:
             FileNotFoundError: If transform or manifest parts not found
+            ValueError: If a manifest part has no seq, or another manifest
+                already wrote the same output file
             RuntimeError: If canonizer fails
         """
         # Read manifest
-        with open(manifest_path, "r") as f:
-            manifest = json.load(f)
+        manifest = json_loads(manifest_path.read_bytes())
 
         run_dir = manifest_path.parent
         parts = manifest.get("parts", [])
@@ -277,11 +360,9 @@ class CanonizerAdapter(ToolAdapter):
                 f"Processing {len(parts)} part(s) from manifest: {manifest_path.name}"
             )
 
-        # Build transform metadata path
-        transform_meta = self.transform_registry / f"{transform_name}.meta.yaml"
-
-        if not transform_meta.exists():
-            raise FileNotFoundError(f"Transform metadata not found: {transform_meta}")
+        transform_meta = _resolve_transform_meta(
+            os.fspath(self.transform_registry), transform_name
+        )
 
         # Build output file path (per-account for idempotency)
         # Extract account from manifest
@@ -292,36 +373,93 @@ class CanonizerAdapter(ToolAdapter):
 
         # Output: canonical/email_gmail/ben-mensio.jsonl
         account_output_dir = output_dir / source
-        account_output_dir.mkdir(parents=True, exist_ok=True)
+
+        if account_output_dir not in self._created_dirs:
+            account_output_dir.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(account_output_dir)
 
         output_file = account_output_dir / f"{account}.jsonl"
 
+        # Group consecutive parts into batches so canonizer startup is paid
+        # once per batch, then transform batches concurrently into temp files
+        part_entries = []
+        run_dir_str = os.fspath(run_dir)
+
+        # Manifests normally list parts in seq order; only sort when they don't
+        seqs = []
+        for part in parts:
+            if "seq" not in part:
+                raise ValueError(
+                    f"Part without seq in manifest {manifest_path}: {part.get('path')}"
+                )
+            seqs.append(part["seq"])
+
+        if any(prev > cur for prev, cur in zip(seqs, seqs[1:])):
+            parts = sorted(parts, key=itemgetter("seq"))
+
+        for part in parts:
+            part_path = os.path.join(run_dir_str, part["path"])
+
+            if not os.path.exists(part_path):
+                if logger:
+                    logger.warning(f"Part file not found: {part_path}")
+                continue
+
+            part_entries.append((part_path, part.get("size_uncompressed")))
+
+        # Output and batch temp files are per account, so only the first
+        # manifest that maps to an account may write them
+        with self._claims_lock:
+            if output_file in self._claimed_outputs:
+                raise ValueError(
+                    f"Output {output_file} is already written by another manifest"
+                )
+            self._claimed_outputs.add(output_file)
+
         # Clear existing output for this account (idempotency: rebuild from LATEST)
         if output_file.exists():
             if logger:
                 logger.debug(f"Clearing existing canonical output: {output_file}")
             output_file.unlink()
 
-        # Process all parts in sequence
-        total_records = 0
+        batch_jobs = []
 
-        for part in sorted(parts, key=lambda p: p.get("seq", 0)):
-            part_path = run_dir / part["path"]
+        for index, batch in enumerate(self._batch_parts(part_entries)):
+            temp_file = account_output_dir / f"{account}.batch-{index:04d}.jsonl.tmp"
+            temp_file.unlink(missing_ok=True)
+            batch_jobs.append((batch, temp_file))
 
-            if not part_path.exists():
-                if logger:
-                    logger.warning(f"Part file not found: {part_path}")
-                continue
+        executor = self._get_executor()
 
-            # Transform this part
-            records = self._transform_gzip_part(
-                part_path=part_path,
-                transform_meta=transform_meta,
-                output_file=output_file,
-                logger=logger,
-            )
+        try:
+            futures = [
+                executor.submit(
+                    self._transform_gzip_parts,
+                    part_paths=batch,
+                    transform_meta=transform_meta,
+                    output_file=temp_file,
+                    logger=logger,
+                )
+                for batch, temp_file in batch_jobs
+            ]
 
-            total_records += records
+            try:
+                total_records = sum(future.result() for future in futures)
+            except BaseException:
+                # Let batches that already started finish before their
+                # temp files are removed below
+                for future in futures:
+                    future.cancel()
+                wait(futures)
+                raise
+
+            # Concatenate in seq order to keep output deterministic
+            self._concatenate_outputs(
+                [temp_file for _, temp_file in batch_jobs], output_file
+            )
+        finally:
+            for _, temp_file in batch_jobs:
+                temp_file.unlink(missing_ok=True)
 
         return {
             "records": total_records,
@@ -330,18 +468,124 @@ class CanonizerAdapter(ToolAdapter):
             "source": source,
         }
 
-    def _transform_gzip_part(
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """
+        Return the worker pool that runs canonizer batches, creating it on first use.
+
+        Returns:
+            ThreadPoolExecutor with max_workers threads
+        """
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="canonizer"
+                )
+            return self._executor
+
+    def close(self) -> None:
+        """Shut down the batch worker pool and release claimed output files."""
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+
+        with self._claims_lock:
+            self._claimed_outputs.clear()
+
+        if executor is not None:
+            executor.shutdown(wait=True)
+
+    @staticmethod
+    def _concatenate_outputs(temp_files: List[Path], output_file: Path) -> None:
+        """
+        Concatenate batch outputs into the final output file, in order.
+
+        The first batch output is renamed into place and the rest are appended
+        with os.sendfile, so the kernel copies the data without passing it
+        through userspace. Falls back to copyfileobj where sendfile cannot
+        write to regular files.
+
+        Args:
+            temp_files: Per-batch output files in seq order
+            output_file: Final output file path
+        """
+        if not temp_files:
+            output_file.write_bytes(b"")
+            return
+
+        os.replace(temp_files[0], output_file)
+
+        # Not opened in append mode: sendfile rejects O_APPEND destinations
+        with open(output_file, "r+b") as out_f:
+            out_f.seek(0, os.SEEK_END)
+
+            for temp_file in temp_files[1:]:
+                with open(temp_file, "rb") as batch_f:
+                    size = os.fstat(batch_f.fileno()).st_size
+                    offset = 0
+
+                    try:
+                        while offset < size:
+                            sent = os.sendfile(
+                                out_f.fileno(), batch_f.fileno(), offset, size - offset
+                            )
+                            if sent == 0:
+                                break
+                            offset += sent
+                    except OSError:
+                        batch_f.seek(offset)
+                        shutil.copyfileobj(batch_f, out_f, STREAM_CHUNK_SIZE)
+                        # Later sendfile calls write to the fd directly, behind
+                        # anything still sitting in the file object's buffer
+                        out_f.flush()
+
+    @staticmethod
+    def _batch_parts(part_entries: List[Tuple[str, Optional[int]]]) -> List[List[str]]:
+        """
+        Group consecutive parts into batches for a single canonizer invocation.
+
+        Batches hold up to BATCH_TARGET_BYTES of decompressed data. Parts
+        without a known uncompressed size get a batch of their own.
+
+        Args:
+            part_entries: (part path, size_uncompressed) tuples in seq order
+
+        Returns:
+            List of batches, each a list of part paths in seq order
+        """
+        batches: List[List[str]] = []
+        batch: List[str] = []
+        batch_bytes = 0
+
+        for part_path, size in part_entries:
+            if size is None:
+                size = BATCH_TARGET_BYTES
+
+            if batch and batch_bytes + size > BATCH_TARGET_BYTES:
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+
+            batch.append(part_path)
+            batch_bytes += size
+
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def _transform_gzip_parts(
         self,
-        part_path: Path,
+        part_paths: List[str],
         transform_meta: Path,
         output_file: Path,
         logger=None,
     ) -> int:
         """
-        Transform a single gzip-compressed JSONL part.
+        Transform a batch of gzip-compressed JSONL parts in one canonizer run.
+
+        Parts are decompressed one at a time (see _open_part) and fed to
+        canonizer back-to-back by _feed_parts.
 
         Args:
-            part_path: Path to part-NNN.jsonl.gz file
+            part_paths: Paths to part-NNN.jsonl.gz files, in seq order
             transform_meta: Transform metadata file
             output_file: Output file path
             logger: Optional logger
@@ -350,7 +594,7 @@ class CanonizerAdapter(ToolAdapter):
             Number of records processed
 
         Raises:
-            RuntimeError: If canonizer fails
+            RuntimeError: If a part cannot be read or canonizer fails
         """
         # Build command
         command = [
@@ -361,39 +605,222 @@ class CanonizerAdapter(ToolAdapter):
             str(transform_meta),
         ]
 
-        if logger:
-            logger.debug(f"Transforming part: {part_path.name}")
+        batch_name = os.path.basename(part_paths[0])
+        if len(part_paths) > 1:
+            batch_name += f"..{os.path.basename(part_paths[-1])}"
 
-        # Decompress and stream to canonizer stdin
-        with gzip.open(part_path, "rt") as gz_file:
-            input_data = gz_file.read()
+        if logger:
+            logger.debug(f"Transforming part(s): {batch_name}")
 
-        # Execute canonizer
-        result = subprocess.run(
+        # Stream decompressed bytes into canonizer stdin while its stdout is
+        # copied to the output file, so neither side is held in memory
+        proc = subprocess.Popen(
             command,
-            input=input_data,
-            capture_output=True,
-            text=True,
-            check=False,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
         )
 
-        if result.returncode != 0:
-            error_msg = (
-                f"Canonizer failed on {part_path.name} with exit code {result.returncode}"
-            )
-            if result.stderr:
-                error_msg += f": {result.stderr[:500]}"
-            raise RuntimeError(error_msg)
+        feed_errors: List[Tuple[str, Exception]] = []
+        stderr_head: List[bytes] = []
+        helpers = [
+            threading.Thread(
+                target=self._feed_parts,
+                args=(part_paths, proc.stdin, feed_errors),
+                daemon=True,
+            ),
+            threading.Thread(
+                target=self._drain_stderr, args=(proc.stderr, stderr_head), daemon=True
+            ),
+        ]
 
-        # Append output to file
-        with open(output_file, "a") as f:
-            f.write(result.stdout)
+        records = 0
+        last_chunk = b""
+        in_record = False
 
-        # Count records in output
-        records = result.stdout.count("\n")
+        try:
+            for helper in helpers:
+                helper.start()
+
+            with open(output_file, "ab", buffering=STREAM_CHUNK_SIZE) as out_f:
+                for chunk in iter(lambda: proc.stdout.read(STREAM_CHUNK_SIZE), b""):
+                    out_f.write(chunk)
+                    lines, in_record = self._count_records(chunk, in_record)
+                    records += lines
+                    last_chunk = chunk
+
+                # Terminate a trailing unterminated record so it is counted and
+                # cannot merge with the next batch when outputs are concatenated
+                if last_chunk and not last_chunk.endswith(b"\n"):
+                    out_f.write(b"\n")
+                    records += in_record
+        except BaseException:
+            # Killing canonizer breaks the feeder's pipe, which in turn
+            # stops and reaps the part decompressor
+            proc.kill()
+            raise
+        finally:
+            for helper in helpers:
+                if helper.ident is not None:
+                    helper.join()
+
+            for pipe in (proc.stdin, proc.stdout, proc.stderr):
+                try:
+                    pipe.close()
+                except BrokenPipeError:
+                    pass
+
+            returncode = proc.wait()
+
+        if feed_errors:
+            failed_part, error = feed_errors[0]
+            raise RuntimeError(
+                f"Failed to read {os.path.basename(failed_part)}: {error}"
+            ) from error
+
+        if returncode != 0:
+            error_msg = f"Canonizer failed on {batch_name} with exit code {returncode}"
+            stderr = b"".join(stderr_head).decode("utf-8", errors="replace")
+            if stderr:
+                error_msg += f": {stderr}"
+            raise RuntimeError(error_msg)
 
         return records
 
+    @staticmethod
+    def _count_records(chunk: bytes, in_record: bool) -> Tuple[int, bool]:
+        """
+        Count records completed in a chunk of streamed JSONL output.
+
+        Blank and whitespace-only lines are not records, matching
+        count_jsonl_records(). Lines may span chunks, so whether the line cut
+        off at the end of the previous chunk had content is carried over.
+
+        Args:
+            chunk: Next block of output bytes
+            in_record: Whether the unterminated line so far has content
+
+        Returns:
+            Tuple of (records terminated in this chunk, in_record after it)
+        """
+        newline_at = chunk.rfind(b"\n")
+        if newline_at == -1:
+            return 0, in_record or bool(chunk.strip())
+
+        blank = len(BLANK_LINE.findall(chunk))
+        if in_record and BLANK_LINE.match(chunk):
+            # The first line continues a line that already had content
+            blank -= 1
+
+        return chunk.count(b"\n") - blank, bool(chunk[newline_at + 1 :].strip())
+
+    @staticmethod
+    def _drain_stderr(stream: BinaryIO, head: List[bytes], limit: int = 500) -> None:
+        """
+        Read a subprocess stderr pipe to EOF, keeping only its first bytes.
+
+        Args:
+            stream: Subprocess stderr pipe
+            head: List receiving the first `limit` bytes for error messages
+            limit: Number of bytes to keep
+        """
+        head.append(stream.read(limit))
+
+        while stream.read(STREAM_CHUNK_SIZE):
+            pass
+
+    @contextlib.contextmanager
+    def _open_part(self, part_path: str) -> Iterator[BinaryIO]:
+        """
+        Open a gzip-compressed part as a stream of decompressed bytes.
+
+        Uses in-process ISA-L when installed, else the external decompressor
+        (pigz/gzip) so decompression runs outside the interpreter, else the
+        stdlib GzipFile.
+
+        Args:
+            part_path: Path to a part-NNN.jsonl.gz file
+
+        Yields:
+            Readable binary stream of decompressed JSONL
+
+        Raises:
+            RuntimeError: If the external decompressor fails
+        """
+        if not self.decompress_bin:
+            # Unbuffered raw file: GzipFile does its own buffering
+            with open(part_path, "rb", buffering=0) as raw_file, gzip_impl.GzipFile(
+                fileobj=raw_file
+            ) as gz_file:
+                yield gz_file
+            return
+
+        proc = subprocess.Popen(
+            [self.decompress_bin, "-dc", part_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+
+        try:
+            yield proc.stdout
+        except BaseException:
+            # Reader gave up (e.g. canonizer exited); don't leave it blocked
+            proc.kill()
+            raise
+        finally:
+            proc.stdout.close()
+            stderr = proc.stderr.read(500)
+            proc.stderr.close()
+            returncode = proc.wait()
+
+        if returncode != 0:
+            error_msg = f"{os.path.basename(self.decompress_bin)} exited with code {returncode}"
+            stderr = stderr.decode("utf-8", errors="replace").strip()
+            if stderr:
+                error_msg += f": {stderr}"
+            raise RuntimeError(error_msg)
+
+    def _feed_parts(
+        self,
+        part_paths: List[str],
+        stdin: BinaryIO,
+        errors: List[Tuple[str, Exception]],
+    ) -> None:
+        """
+        Decompress parts back-to-back into a subprocess stdin, then close it.
+
+        A newline is inserted between parts that do not end with one, so
+        records never merge across part boundaries.
+
+        Args:
+            part_paths: Paths to gzip-compressed JSONL parts, in seq order
+            stdin: Subprocess stdin pipe
+            errors: List collecting (part, error) read failures for the calling thread
+        """
+        part_path = None
+
+        try:
+            for part_path in part_paths:
+                last_chunk = b""
+
+                with self._open_part(part_path) as part_f:
+                    for chunk in iter(lambda: part_f.read(GZIP_READ_SIZE), b""):
+                        stdin.write(chunk)
+                        last_chunk = chunk
+
+                if last_chunk and not last_chunk.endswith(b"\n"):
+                    stdin.write(b"\n")
+        except BrokenPipeError:
+            # Canonizer exited early; its exit code reports the failure
+            pass
+        except Exception as e:
+            errors.append((part_path, e))
+        finally:
+            try:
+                stdin.close()
+            except BrokenPipeError:
+                pass
+
     def execute(self, *args, **kwargs) -> Any:
         """
         Execute canonizer command (generic interface).
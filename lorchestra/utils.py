@@ -192,6 +192,71 @@ def validate_file_is_jsonl(file_path: Path) -> bool:
         return False
 
 
+def validate_file_is_jsonl_sampled(file_path: Path, sample_lines: int = 32) -> bool:
+    """
+    Validate a JSONL file by parsing a sample of its lines.
+
+    Parses the first line that starts at or after each of `sample_lines`
+    evenly spaced offsets across the file, plus the last line, so cost stays
+    constant regardless of file size and the same file always gets the same
+    verdict. Use validate_file_is_jsonl() when every line must be checked.
+
+    Args:
+        file_path: Path to JSONL file
+        sample_lines: Number of offsets to sample lines at
+
+    Returns:
+        True if all sampled lines are valid JSON, False otherwise
+    """
+    window_size = 64 * 1024
+    sample = []
+    seen_starts = set()
+
+    with open(file_path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+
+        for i in range(sample_lines):
+            offset = size * i // sample_lines
+
+            # Read from one byte early so a line starting exactly at the
+            # offset is recognised by the newline before it
+            window_start = max(0, offset - 1)
+            f.seek(window_start)
+            window = f.read(window_size)
+
+            if offset == 0:
+                start = 0
+            else:
+                start = window.find(b"\n") + 1
+                if start == 0:
+                    continue
+
+            end = window.find(b"\n", start)
+            if end == -1:
+                # Lines longer than the window are skipped unless they end the file
+                if window_start + len(window) < size:
+                    continue
+                end = len(window)
+
+            if window_start + start not in seen_starts:
+                seen_starts.add(window_start + start)
+                sample.append(window[start:end])
+
+        # The last line is always checked, when it fits in one window
+        f.seek(max(0, size - window_size))
+        tail_lines = f.read().rstrip().split(b"\n")
+        if len(tail_lines) > 1 or size <= window_size:
+            sample.append(tail_lines[-1])
+
+    try:
+        for line in sample:
+            if line.strip():
+                json.loads(line)
+        return True
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return False
+
+
 def count_jsonl_records(file_path: Path) -> int:
     """
     Count records in a JSONL file.
@@ -203,7 +268,8 @@ def count_jsonl_records(file_path: Path) -> int:
         Number of records (non-empty lines)
     """
     count = 0
-    with open(file_path, "r") as f:
+    # Binary mode: counting lines does not need a UTF-8 decode of the file
+    with open(file_path, "rb") as f:
         for line in f:
             if line.strip():
                 count += 1
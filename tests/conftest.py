@@ -0,0 +1,87 @@
+"""Shared fixtures for lorchestra tests."""
+
+import gzip
+import json
+from pathlib import Path
+from typing import Callable, List, Optional
+
+import pytest
+
+
+@pytest.fixture
+def make_vault(tmp_path: Path) -> Callable:
+    """
+    Build a vault run with a LATEST pointer and gzip-compressed parts.
+
+    Returns a function taking (source, account, parts), where parts is a list
+    of raw part contents in seq order. Manifests list parts in reverse unless
+    in_order is set, so the adapter has to sort them. manifest_account
+    overrides the account recorded in the manifest.
+    """
+
+    def _make_vault(
+        source: str,
+        account: str,
+        parts: List[bytes],
+        in_order: bool = False,
+        manifest_account: Optional[str] = None,
+    ) -> Path:
+        account_dir = tmp_path / "vault" / source / account
+        run_dir = account_dir / "dt=2025-01-01" / "run_id=20250101T000000Z"
+        run_dir.mkdir(parents=True)
+
+        manifest_parts = []
+        for seq, data in enumerate(parts):
+            part_path = run_dir / f"part-{seq:03d}.jsonl.gz"
+            part_path.write_bytes(gzip.compress(data))
+            manifest_parts.append(
+                {"path": part_path.name, "seq": seq, "size_uncompressed": len(data)}
+            )
+
+        manifest = {
+            "source": source,
+            "account": manifest_account or account,
+            "parts": manifest_parts if in_order else manifest_parts[::-1],
+        }
+        (run_dir / "manifest.json").write_text(json.dumps(manifest))
+        (account_dir / "LATEST.json").write_text(
+            json.dumps({"dt": "2025-01-01", "run_id": "20250101T000000Z"})
+        )
+
+        return run_dir / "manifest.json"
+
+    return _make_vault
+
+
+@pytest.fixture
+def canonizer_dir(tmp_path: Path) -> Path:
+    """Canonizer checkout whose `can` passes records through unchanged."""
+    can_bin = tmp_path / "canonizer" / ".venv" / "bin" / "can"
+    can_bin.parent.mkdir(parents=True)
+    can_bin.write_text("#!/bin/sh\nexec cat\n")
+    can_bin.chmod(0o755)
+    return tmp_path / "canonizer"
+
+
+@pytest.fixture
+def transform_registry(tmp_path: Path) -> Path:
+    """Transform registry holding an email/identity_v1 transform."""
+    registry = tmp_path / "transforms"
+    (registry / "email").mkdir(parents=True)
+    (registry / "email" / "identity_v1.meta.yaml").write_text("name: identity_v1\n")
+    return registry
+
+
+@pytest.fixture
+def adapter(tmp_path: Path, canonizer_dir: Path, transform_registry: Path):
+    """CanonizerAdapter backed by the pass-through canonizer stub."""
+    from lorchestra.tools.canonizer import CanonizerAdapter
+
+    adapter = CanonizerAdapter(
+        canonizer_dir=canonizer_dir,
+        transform_registry=transform_registry,
+        config_cache=tmp_path / "canonizer.yaml",
+        max_workers=2,
+    )
+    yield adapter
+    adapter.close()
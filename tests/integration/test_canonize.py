@@ -0,0 +1,112 @@
+"""End-to-end canonize stage runs against a pass-through canonizer stub."""
+
+import json
+import logging
+
+from lorchestra.config import StageConfig
+from lorchestra.stages.canonize import CanonizeStage
+
+
+def _records(start, count, terminated=True):
+    data = b"\n".join(json.dumps({"n": n}).encode() for n in range(start, start + count))
+    return data + b"\n" if terminated else data
+
+
+def _stage(tmp_path, canonizer_dir, transform_registry, mappings, max_workers=4):
+    config = StageConfig(
+        "canonize",
+        {
+            "type": "canonizer",
+            "repo_path": str(canonizer_dir),
+            "transform_registry": str(transform_registry),
+            "input_dir": str(tmp_path / "vault"),
+            "output_dir": str(tmp_path / "canonical"),
+            "max_workers": max_workers,
+            "mappings": mappings,
+        },
+    )
+    return CanonizeStage(config, logging.getLogger("test"))
+
+
+def _read_ns(path):
+    return [json.loads(line)["n"] for line in path.read_bytes().splitlines()]
+
+
+def test_canonize_vault(tmp_path, make_vault, canonizer_dir, transform_registry):
+    make_vault(
+        "email/gmail",
+        "acct1",
+        [_records(0, 100), _records(100, 50, terminated=False), _records(150, 25)],
+    )
+    make_vault("email/gmail", "acct2", [_records(0, 10)])
+    mappings = [{"source_pattern": "email/gmail", "transform": "email/identity_v1"}]
+
+    result = _stage(tmp_path, canonizer_dir, transform_registry, mappings).run()
+
+    output_dir = tmp_path / "canonical" / "email_gmail"
+    assert result.success, result.error_message
+    assert result.records_processed == 185
+    assert result.output_files == [output_dir / "acct1.jsonl", output_dir / "acct2.jsonl"]
+    assert _read_ns(output_dir / "acct1.jsonl") == list(range(175))
+    assert _read_ns(output_dir / "acct2.jsonl") == list(range(10))
+    assert sorted(path.name for path in output_dir.iterdir()) == ["acct1.jsonl", "acct2.jsonl"]
+
+
+def test_rerun_is_idempotent(tmp_path, make_vault, canonizer_dir, transform_registry):
+    make_vault("email/gmail", "acct1", [_records(0, 100), _records(100, 100)])
+    mappings = [{"source_pattern": "email/gmail", "transform": "email/identity_v1"}]
+
+    first = _stage(tmp_path, canonizer_dir, transform_registry, mappings).run()
+    output = (tmp_path / "canonical" / "email_gmail" / "acct1.jsonl").read_bytes()
+    second = _stage(tmp_path, canonizer_dir, transform_registry, mappings, max_workers=1).run()
+
+    assert first.records_processed == second.records_processed == 200
+    assert (tmp_path / "canonical" / "email_gmail" / "acct1.jsonl").read_bytes() == output
+
+
+def test_manifest_matched_twice_runs_once(
+    tmp_path, make_vault, canonizer_dir, transform_registry
+):
+    make_vault("email/gmail", "acct1", [_records(0, 20)])
+    mappings = [
+        {"source_pattern": "email/gmail", "transform": "email/identity_v1"},
+        {"source_pattern": "email/gmail", "transform": "email/identity_v1"},
+    ]
+
+    result = _stage(tmp_path, canonizer_dir, transform_registry, mappings).run()
+
+    assert result.success
+    assert result.records_processed == 20
+    assert result.metadata["errors"] == 1
+
+
+def test_manifests_for_same_output_write_once(
+    tmp_path, make_vault, canonizer_dir, transform_registry
+):
+    # Both runs claim account "a"; only one may write a.jsonl
+    make_vault("email/gmail", "a", [_records(0, 1)])
+    make_vault("email/gmail", "b", [_records(0, 2)], manifest_account="a")
+    mappings = [{"source_pattern": "email/gmail", "transform": "email/identity_v1"}]
+
+    result = _stage(tmp_path, canonizer_dir, transform_registry, mappings).run()
+
+    output_file = tmp_path / "canonical" / "email_gmail" / "a.jsonl"
+    assert result.success
+    assert result.metadata["errors"] == 1
+    assert result.output_files == [output_file]
+    assert result.records_processed == len(_read_ns(output_file))
+    assert _read_ns(output_file) in ([0], [0, 1])
+
+
+def test_canonizer_failure_reported(tmp_path, make_vault, canonizer_dir, transform_registry):
+    make_vault("email/gmail", "acct1", [_records(0, 20)])
+    (canonizer_dir / ".venv" / "bin" / "can").write_text(
+        "#!/bin/sh\ncat >/dev/null\necho 'bad transform' >&2\nexit 2\n"
+    )
+    mappings = [{"source_pattern": "email/gmail", "transform": "email/identity_v1"}]
+
+    result = _stage(tmp_path, canonizer_dir, transform_registry, mappings).run()
+
+    assert not result.success
+    assert "exit code 2: bad transform" in result.error_message
+    assert not list((tmp_path / "canonical" / "email_gmail").glob("*.tmp"))
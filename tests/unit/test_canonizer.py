@@ -0,0 +1,294 @@
+"""Tests for CanonizerAdapter manifest handling, batching, and output assembly."""
+
+import gzip
+import json
+import os
+import shutil
+import threading
+from pathlib import Path
+
+import pytest
+
+from lorchestra.tools import canonizer
+from lorchestra.tools.canonizer import BATCH_TARGET_BYTES, CanonizerAdapter
+
+MIB = 1024 * 1024
+
+
+def _write_parts(directory, contents):
+    """Write gzip-compressed parts and return their paths in seq order."""
+    part_paths = []
+    for seq, data in enumerate(contents):
+        part_path = directory / f"part-{seq:03d}.jsonl.gz"
+        part_path.write_bytes(gzip.compress(data))
+        part_paths.append(str(part_path))
+    return part_paths
+
+
+def _feed(adapter, part_paths):
+    """Run _feed_parts into a pipe and return (bytes fed, errors)."""
+    read_fd, write_fd = os.pipe()
+    errors = []
+    chunks = []
+
+    with os.fdopen(read_fd, "rb") as reader:
+        reader_thread = threading.Thread(target=lambda: chunks.append(reader.read()))
+        reader_thread.start()
+        adapter._feed_parts(part_paths, os.fdopen(write_fd, "wb"), errors)
+        reader_thread.join()
+
+    return chunks[0], errors
+
+
+class TestFindLatestManifests:
+    def test_finds_latest_run_per_account(self, tmp_path, adapter, make_vault):
+        acct1 = make_vault("email/gmail", "acct1", [b'{"n": 0}\n'])
+        acct2 = make_vault("email/gmail", "acct2", [b'{"n": 0}\n'])
+        older_run = acct1.parent.parent / "run_id=20241231T000000Z"
+        older_run.mkdir()
+        (older_run / "manifest.json").write_text("{}")
+
+        manifests = adapter.find_latest_manifests(tmp_path / "vault", "email/gmail")
+
+        assert sorted(manifests) == [acct1, acct2]
+
+    def test_skips_files_and_accounts_without_latest(self, tmp_path, adapter, make_vault):
+        manifest = make_vault("email/gmail", "acct1", [b'{"n": 0}\n'])
+        source_dir = tmp_path / "vault" / "email" / "gmail"
+        (source_dir / "notes.txt").write_text("not an account")
+        (source_dir / "no-latest").mkdir()
+
+        assert adapter.find_latest_manifests(tmp_path / "vault", "email/gmail") == [manifest]
+
+    def test_skips_latest_pointing_at_missing_run(self, tmp_path, adapter, make_vault):
+        manifest = make_vault("email/gmail", "acct1", [b'{"n": 0}\n'])
+        stale_dir = tmp_path / "vault" / "email" / "gmail" / "stale"
+        stale_dir.mkdir()
+        (stale_dir / "LATEST.json").write_text(json.dumps({"dt": "2025-01-01", "run_id": "X"}))
+        invalid_dir = stale_dir.parent / "invalid"
+        invalid_dir.mkdir()
+        (invalid_dir / "LATEST.json").write_text(json.dumps({"dt": "2025-01-01"}))
+
+        assert adapter.find_latest_manifests(tmp_path / "vault", "email/gmail") == [manifest]
+
+    def test_missing_source_dir(self, tmp_path, adapter):
+        assert adapter.find_latest_manifests(tmp_path / "vault", "email/gmail") == []
+
+    def test_source_path_is_a_file(self, tmp_path, adapter):
+        (tmp_path / "vault" / "email").mkdir(parents=True)
+        (tmp_path / "vault" / "email" / "gmail").write_text("not a directory")
+
+        assert adapter.find_latest_manifests(tmp_path / "vault", "email/gmail") == []
+
+
+class TestTransformFromManifest:
+    def test_second_manifest_for_same_output_rejected(self, tmp_path, adapter, make_vault):
+        first = make_vault("email/gmail", "a", [b'{"n": 0}\n'])
+        second = make_vault("email/gmail", "b", [b'{"n": 1}\n{"n": 2}\n'], manifest_account="a")
+        output_dir = tmp_path / "canonical"
+
+        result = adapter.transform_from_manifest(first, "email/identity_v1", output_dir)
+        with pytest.raises(ValueError, match="already written by another manifest"):
+            adapter.transform_from_manifest(second, "email/identity_v1", output_dir)
+
+        assert result["records"] == 1
+        assert Path(result["output_file"]).read_bytes() == b'{"n": 0}\n'
+
+    def test_close_releases_outputs(self, tmp_path, adapter, make_vault):
+        manifest = make_vault("email/gmail", "a", [b'{"n": 0}\n'])
+        output_dir = tmp_path / "canonical"
+
+        adapter.transform_from_manifest(manifest, "email/identity_v1", output_dir)
+        adapter.close()
+        result = adapter.transform_from_manifest(manifest, "email/identity_v1", output_dir)
+
+        assert result["records"] == 1
+
+
+    @pytest.mark.parametrize("in_order", [True, False])
+    def test_parts_concatenated_in_seq_order(self, tmp_path, adapter, make_vault, in_order):
+        contents = [b'{"n": 0}\n', b'{"n": 1}\n', b'{"n": 2}\n']
+        manifest = make_vault("email/gmail", "a", contents, in_order=in_order)
+
+        result = adapter.transform_from_manifest(
+            manifest, "email/identity_v1", tmp_path / "canonical"
+        )
+
+        assert Path(result["output_file"]).read_bytes() == b"".join(contents)
+
+    def test_parts_in_order_are_not_sorted(self, tmp_path, adapter, make_vault, monkeypatch):
+        manifest = make_vault("email/gmail", "a", [b'{"n": 0}\n', b'{"n": 1}\n'], in_order=True)
+
+        def fail_sorted(*args, **kwargs):
+            raise AssertionError("parts already in seq order were re-sorted")
+
+        monkeypatch.setattr(canonizer, "sorted", fail_sorted, raising=False)
+
+        result = adapter.transform_from_manifest(
+            manifest, "email/identity_v1", tmp_path / "canonical"
+        )
+
+        assert result["records"] == 2
+
+    def test_part_without_seq_rejected(self, tmp_path, adapter, make_vault):
+        manifest = make_vault("email/gmail", "a", [b'{"n": 0}\n', b'{"n": 1}\n'])
+        manifest_data = json.loads(manifest.read_text())
+        del manifest_data["parts"][1]["seq"]
+        manifest.write_text(json.dumps(manifest_data))
+
+        with pytest.raises(ValueError, match="Part without seq in manifest .*: part-000"):
+            adapter.transform_from_manifest(manifest, "email/identity_v1", tmp_path / "canonical")
+
+
+class TestBatchParts:
+    def test_small_parts_share_one_batch(self):
+        entries = [(f"part-{i:03d}", MIB) for i in range(30)]
+
+        assert CanonizerAdapter._batch_parts(entries) == [[path for path, _ in entries]]
+
+    def test_batches_stay_under_target_in_order(self):
+        size = BATCH_TARGET_BYTES // 3 + 1
+        entries = [(f"part-{i:03d}", size) for i in range(5)]
+
+        assert CanonizerAdapter._batch_parts(entries) == [
+            ["part-000", "part-001"],
+            ["part-002", "part-003"],
+            ["part-004"],
+        ]
+
+    def test_oversized_part_gets_own_batch(self):
+        entries = [("a", MIB), ("b", BATCH_TARGET_BYTES * 2), ("c", MIB)]
+
+        assert CanonizerAdapter._batch_parts(entries) == [["a"], ["b"], ["c"]]
+
+    def test_unknown_size_gets_own_batch(self):
+        entries = [("a", MIB), ("b", None), ("c", MIB), ("d", MIB)]
+
+        assert CanonizerAdapter._batch_parts(entries) == [["a"], ["b"], ["c", "d"]]
+
+    def test_empty_part_joins_batch(self):
+        entries = [("a", 10), ("b", 0), ("c", 10)]
+
+        assert CanonizerAdapter._batch_parts(entries) == [["a", "b", "c"]]
+
+    def test_no_parts(self):
+        assert CanonizerAdapter._batch_parts([]) == []
+
+
+class TestRecordCounting:
+    @pytest.mark.parametrize(
+        "output, expected",
+        [
+            (b'{"n": 1}\n\n{"n": 2}\n\n', 2),
+            (b'\n\n{"n": 1}\n  \n\t\r\n{"n": 2}', 2),
+            (b"\n \n", 0),
+        ],
+    )
+    def test_blank_lines_not_counted(self, tmp_path, adapter, output, expected):
+        can_output = tmp_path / "can-output"
+        can_output.write_bytes(output)
+        adapter.can_bin.write_text(f"#!/bin/sh\ncat >/dev/null\ncat {can_output}\n")
+        output_file = tmp_path / "out.jsonl"
+
+        records = adapter._transform_gzip_parts(
+            _write_parts(tmp_path, [b'{"n": 0}\n']), tmp_path / "t.meta.yaml", output_file
+        )
+
+        assert records == expected
+        assert output_file.read_bytes().endswith(b"\n")
+
+    def test_lines_split_across_chunks(self):
+        output = b'{"n": 1}\n\n  {"n": 2}\n \n{"n": 3}\n'
+
+        for split in range(len(output) + 1):
+            first, in_record = CanonizerAdapter._count_records(output[:split], False)
+            second, in_record = CanonizerAdapter._count_records(output[split:], in_record)
+
+            assert (first + second, in_record) == (3, False)
+
+
+class TestConcatenateOutputs:
+    def _temp_files(self, tmp_path, contents):
+        temp_files = []
+        for index, data in enumerate(contents):
+            temp_file = tmp_path / f"out.batch-{index:04d}.jsonl.tmp"
+            temp_file.write_bytes(data)
+            temp_files.append(temp_file)
+        return temp_files
+
+    def test_concatenates_in_order(self, tmp_path):
+        contents = [b"first\n", b"second\n" * 1000, b"", b"fourth\n"]
+        output_file = tmp_path / "out.jsonl"
+        output_file.write_bytes(b"stale output\n")
+
+        CanonizerAdapter._concatenate_outputs(self._temp_files(tmp_path, contents), output_file)
+
+        assert output_file.read_bytes() == b"".join(contents)
+
+    def test_no_batches_writes_empty_file(self, tmp_path):
+        output_file = tmp_path / "out.jsonl"
+
+        CanonizerAdapter._concatenate_outputs([], output_file)
+
+        assert output_file.read_bytes() == b""
+
+    def test_falls_back_after_partial_sendfile(self, tmp_path, monkeypatch):
+        contents = [b"a\n" * 10, b"b\n" * 10, b"c\n" * 10, b"d\n" * 10]
+        output_file = tmp_path / "out.jsonl"
+        real_sendfile = os.sendfile
+        calls = []
+
+        def flaky_sendfile(out_fd, in_fd, offset, count):
+            # Second batch: copy a few bytes, then fail like an unsupported fs
+            calls.append(offset)
+            if len(calls) == 1:
+                return real_sendfile(out_fd, in_fd, offset, 5)
+            if len(calls) == 2:
+                raise OSError(22, "Invalid argument")
+            return real_sendfile(out_fd, in_fd, offset, count)
+
+        monkeypatch.setattr(os, "sendfile", flaky_sendfile)
+
+        CanonizerAdapter._concatenate_outputs(self._temp_files(tmp_path, contents), output_file)
+
+        assert calls[:2] == [0, 5]
+        assert output_file.read_bytes() == b"".join(contents)
+
+
+class TestFeedParts:
+    @pytest.fixture(params=["in-process", "gzip"])
+    def feeding_adapter(self, request, adapter):
+        if request.param == "in-process":
+            adapter.decompress_bin = None
+        else:
+            adapter.decompress_bin = shutil.which("gzip")
+            if adapter.decompress_bin is None:
+                pytest.skip("gzip not installed")
+        return adapter
+
+    def test_newline_between_unterminated_parts(self, tmp_path, feeding_adapter):
+        part_paths = _write_parts(
+            tmp_path, [b'{"n": 0}\n{"n": 1}', b'{"n": 2}', b'{"n": 3}\n']
+        )
+
+        fed, errors = _feed(feeding_adapter, part_paths)
+
+        assert errors == []
+        assert fed == b'{"n": 0}\n{"n": 1}\n{"n": 2}\n{"n": 3}\n'
+
+    def test_terminated_and_empty_parts_unchanged(self, tmp_path, feeding_adapter):
+        part_paths = _write_parts(tmp_path, [b'{"n": 0}\n', b"", b'{"n": 1}\n'])
+
+        fed, errors = _feed(feeding_adapter, part_paths)
+
+        assert errors == []
+        assert fed == b'{"n": 0}\n{"n": 1}\n'
+
+    def test_corrupt_part_reported(self, tmp_path, feeding_adapter):
+        part_paths = _write_parts(tmp_path, [b'{"n": 0}\n', b'{"n": 1}\n' * 100])
+        Path(part_paths[1]).write_bytes(Path(part_paths[1]).read_bytes()[:20])
+
+        fed, errors = _feed(feeding_adapter, part_paths)
+
+        assert [part for part, _ in errors] == [part_paths[1]]
+        assert fed.startswith(b'{"n": 0}\n')
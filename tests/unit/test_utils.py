@@ -0,0 +1,70 @@
+"""Tests for lorchestra.utils JSONL helpers."""
+
+import json
+
+from lorchestra.utils import count_jsonl_records, validate_file_is_jsonl_sampled
+
+
+def _write_records(path, count, pad=0):
+    lines = [json.dumps({"n": n, "pad": "x" * (n % pad if pad else 0)}) for n in range(count)]
+    path.write_text("\n".join(lines) + "\n")
+    return lines
+
+
+class TestValidateFileIsJsonlSampled:
+    def test_valid_file(self, tmp_path):
+        output_file = tmp_path / "out.jsonl"
+        _write_records(output_file, 50_000, pad=200)
+
+        assert validate_file_is_jsonl_sampled(output_file)
+
+    def test_empty_file(self, tmp_path):
+        output_file = tmp_path / "out.jsonl"
+        output_file.write_bytes(b"")
+
+        assert validate_file_is_jsonl_sampled(output_file)
+
+    def test_invalid_last_line(self, tmp_path):
+        output_file = tmp_path / "out.jsonl"
+        _write_records(output_file, 50_000, pad=200)
+        with open(output_file, "a") as f:
+            f.write('{"n": ')
+
+        assert not validate_file_is_jsonl_sampled(output_file)
+
+    def test_corruption_past_first_mib(self, tmp_path):
+        output_file = tmp_path / "out.jsonl"
+        lines = _write_records(output_file, 50_000, pad=200)
+        assert output_file.stat().st_size > 4 * 1024 * 1024
+
+        # Corrupt a contiguous block in the back half, away from the last line
+        for n in range(30_000, 40_000):
+            lines[n] = "not json"
+        output_file.write_text("\n".join(lines) + "\n")
+
+        assert not validate_file_is_jsonl_sampled(output_file)
+
+    def test_deterministic(self, tmp_path):
+        output_file = tmp_path / "out.jsonl"
+        lines = _write_records(output_file, 20_000)
+        for n in range(0, 20_000, 97):
+            lines[n] = "not json"
+        output_file.write_text("\n".join(lines) + "\n")
+
+        verdicts = {validate_file_is_jsonl_sampled(output_file) for _ in range(20)}
+
+        assert len(verdicts) == 1
+
+    def test_line_longer_than_window(self, tmp_path):
+        output_file = tmp_path / "out.jsonl"
+        big = json.dumps({"body": "x" * 200_000})
+        output_file.write_text("\n".join([big, '{"n": 1}', big]) + "\n")
+
+        assert validate_file_is_jsonl_sampled(output_file)
+
+
+def test_count_jsonl_records_skips_blank_lines(tmp_path):
+    output_file = tmp_path / "out.jsonl"
+    output_file.write_text('{"n": 0}\n\n{"n": 1}\n   \n{"n": 2}')
+
+    assert count_jsonl_records(output_file) == 3